@@ -3,17 +3,18 @@ import PyQt5.QtGui as qtg
 import PyQt5.QtCore as qtc
 import PyQt5.QtWidgets as qtw
 import math
-from scipy import optimize
-from copy import deepcopy as dc
-from scipy.integrate import odeint
 import numpy as np
+import os
 import logging
+from logging.handlers import RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
+from FourBar_Kernels import simulate, pose_from_angles
 #endregion
 
 # Set up logging to capture errors and debugging information
 logging.basicConfig(
-    filename='fourbar_debug.log',
-    level=logging.DEBUG,
+    handlers=[RotatingFileHandler('fourbar_debug.log', maxBytes=1_000_000, backupCount=2, delay=True)],
+    level=logging.WARNING,
     format='%(asctime)s:%(levelname)s:%(message)s'
 )
 
@@ -32,8 +33,8 @@ class RigidLink(qtw.QGraphicsItem):
     Attributes:
         stPt (QPointF): Starting point of the link.
         enPt (QPointF): Ending point of the link.
-        length (float): Length of the link.
-        angle (float): Angle of the link in radians.
+        length (float): Length of the link, stored in the model's lengths array once bound.
+        angle (float): Angle of the link in radians, stored in the model's angles array once bound.
         radius (float): Radius for drawing the link's ends.
         mass (float): Mass of the link.
         pen (QPen): Pen for drawing the link.
@@ -62,6 +63,9 @@ class RigidLink(qtw.QGraphicsItem):
             label_pen (QPen): Pen for drawing the label.
         """
         super().__init__(parent)
+        self._angles = None
+        self._lengths = None
+        self._index = 0
         self.pen = pen
         self.label_pen = label_pen
         self.brush = brush
@@ -75,6 +79,45 @@ class RigidLink(qtw.QGraphicsItem):
         self.transform = qtg.QTransform()
         self.transform.reset()
 
+    @property
+    def angle(self):
+        """float: Angle of the link in radians."""
+        return self._angle if self._angles is None else float(self._angles[self._index])
+
+    @angle.setter
+    def angle(self, value):
+        if self._angles is None:
+            self._angle = value
+        else:
+            self._angles[self._index] = value
+
+    @property
+    def length(self):
+        """float: Length of the link."""
+        return self._length if self._lengths is None else float(self._lengths[self._index])
+
+    @length.setter
+    def length(self, value):
+        if self._lengths is None:
+            self._length = value
+        else:
+            self._lengths[self._index] = value
+
+    def bindState(self, angles, lengths, index):
+        """Keep the link's angle and length in shared model arrays instead of on the item.
+
+        Args:
+            angles (numpy.ndarray): Array of link angles.
+            lengths (numpy.ndarray): Array of link lengths.
+            index (int): Slot of this link in both arrays.
+        """
+        angle, length = self.angle, self.length
+        self._angles = angles
+        self._lengths = lengths
+        self._index = index
+        self.angle = angle
+        self.length = length
+
     def boundingRect(self):
         """Return the bounding rectangle of the link after transformation.
 
@@ -150,8 +193,10 @@ class RigidLink(qtw.QGraphicsItem):
             widget (QWidget, optional): The widget being painted on.
         """
         path = qtg.QPainterPath()
-        len = self.linkLength()
-        angLink = self.linkAngle() * 180 / math.pi
+        if self._angles is None:
+            self.linkAngle()  # Links bound to the model get their angle and length from it instead
+        len = self.length
+        angLink = self.angle * 180 / math.pi
         rectSt = qtc.QRectF(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius)
         rectEn = qtc.QRectF(self.length - self.radius, -self.radius, 2 * self.radius, 2 * self.radius)
         centerLinePen = qtg.QPen()
@@ -324,14 +369,21 @@ class RigidPivotPoint(qtw.QGraphicsItem):
 class Tracer(qtw.QGraphicsItem):
     """A tracer that tracks the path of a point in the four-bar linkage.
 
+    The traced points are kept in a fixed-capacity float32 ring buffer, normally a row of the model's shared
+    tracer buffer, and the oldest point is overwritten once it is full. The QPainterPath drawn by paint() is
+    rebuilt from the buffer by refresh(), at most once per displayed frame.
+
     Attributes:
-        pts (list[QPointF]): List of points in the tracer path.
+        xy (numpy.ndarray): Ring buffer of shape (capacity, 2) holding the traced points.
+        head (int): Slot in xy that the next point is written to.
+        count (int): Number of points currently stored in xy.
+        path (QPainterPath): Path through the stored points, oldest first.
         rect (QRectF): Bounding rectangle for the tracer.
         pen (QPen): Pen for drawing the tracer path.
         penOutline (QPen): Pen for drawing the current point marker.
     """
 
-    def __init__(self, x=0, y=0, pen=None, penOutline=qtg.QPen(qtc.Qt.black)):
+    def __init__(self, x=0, y=0, pen=None, penOutline=qtg.QPen(qtc.Qt.black), capacity=1000):
         """Initialize a tracer starting at the given position.
 
         Args:
@@ -339,12 +391,56 @@ class Tracer(qtw.QGraphicsItem):
             y (float): Initial y-coordinate.
             pen (QPen, optional): Pen for drawing the path.
             penOutline (QPen, optional): Pen for drawing the current point marker.
+            capacity (int): Maximum number of points kept in the path.
         """
         super().__init__()
-        self.pts = [qtc.QPointF(x, y)]
-        self.rect = qtc.QRectF(-5, -5, 10, 10)
+        self.xy = np.empty((capacity, 2), dtype=np.float32)
+        self._heads = np.zeros(1, dtype=np.int32)
+        self._counts = np.zeros(1, dtype=np.int32)
+        self._index = 0
+        self._dirty = True
         self.pen = pen
         self.penOutline = penOutline
+        self.rect = qtc.QRectF()
+        self.reset(qtc.QPointF(x, y))
+
+    @property
+    def head(self):
+        """int: Slot in xy that the next point is written to."""
+        return int(self._heads[self._index])
+
+    @head.setter
+    def head(self, value):
+        self._heads[self._index] = value
+
+    @property
+    def count(self):
+        """int: Number of points currently stored in xy."""
+        return int(self._counts[self._index])
+
+    @count.setter
+    def count(self, value):
+        self._counts[self._index] = value
+
+    def bindBuffer(self, xy, heads, counts, index):
+        """Move the tracer's points into a row of shared ring buffers.
+
+        Args:
+            xy (numpy.ndarray): Point buffers of shape (n_tracers, capacity, 2).
+            heads (numpy.ndarray): Head index of each tracer.
+            counts (numpy.ndarray): Point count of each tracer.
+            index (int): Row of this tracer in the shared buffers.
+        """
+        pts = self.points()[-xy.shape[1]:]
+        self.xy = xy[index]
+        self._heads = heads
+        self._counts = counts
+        self._index = index
+        self.xy[:len(pts)] = pts
+        self.count = len(pts)
+        self.head = len(pts) % len(self.xy)
+        self._dirty = True
+        self.refresh()
 
     def boundingRect(self):
         """Return the bounding rectangle of the tracer.
@@ -355,13 +451,93 @@ class Tracer(qtw.QGraphicsItem):
         bounding_rect = self.rect
         return bounding_rect
 
+    def points(self):
+        """Return the stored points, oldest first.
+
+        Returns:
+            numpy.ndarray: Array of shape (count, 2).
+        """
+        if self.count < len(self.xy):
+            return self.xy[:self.count].copy()
+        return np.concatenate((self.xy[self.head:], self.xy[:self.head]))
+
+    def firstPt(self):
+        """Return the first (oldest) point in the tracer path.
+
+        Returns:
+            QPointF: The first point.
+        """
+        i = (self.head - self.count) % len(self.xy)
+        return qtc.QPointF(float(self.xy[i, 0]), float(self.xy[i, 1]))
+
     def lastPt(self):
         """Return the last point in the tracer path.
 
         Returns:
             QPointF: The last point.
         """
-        return self.pts[len(self.pts) - 1]
+        i = (self.head - 1) % len(self.xy)
+        return qtc.QPointF(float(self.xy[i, 0]), float(self.xy[i, 1]))
+
+    def reset(self, pt=None):
+        """Clear the tracer path, keeping only its starting point.
+
+        Args:
+            pt (QPointF, optional): New starting point. Defaults to the current first point.
+        """
+        if pt is None:
+            pt = self.firstPt()
+        self.xy[0] = (pt.x(), pt.y())
+        self.head = 1 % len(self.xy)
+        self.count = 1
+        self._dirty = True
+        self.refresh()
+
+    def addPoint(self, pt):
+        """Append a point to the ring buffer, overwriting the oldest one when it is full.
+
+        Args:
+            pt (QPointF): Point to append.
+        """
+        i = self.head
+        self.xy[i] = (pt.x(), pt.y())
+        self.head = (i + 1) % len(self.xy)
+        self.count = min(self.count + 1, len(self.xy))
+        self._dirty = True
+
+    def refresh(self, visibleRect=None):
+        """Rebuild the path and bounding rectangle from the ring buffer if points were added.
+
+        Args:
+            visibleRect (QRectF, optional): Visible part of the scene. When given, the path of a tracer that lies
+                outside it is left stale and rebuilt by paint() once Qt exposes the tracer again.
+        """
+        if not self._dirty:
+            return
+        n = self.count
+        lo = self.xy[:n].min(axis=0)
+        hi = self.xy[:n].max(axis=0)
+        rect = qtc.QRectF(float(lo[0]) - 5, float(lo[1]) - 5, float(hi[0] - lo[0]) + 10, float(hi[1] - lo[1]) + 10)
+        if rect != self.rect:
+            self.prepareGeometryChange()
+            self.rect = rect
+        if visibleRect is not None and not visibleRect.intersects(self.mapRectToScene(rect)):
+            return
+        # Fill a QPolygonF directly through its buffer rather than constructing a QPointF per point
+        polygon = qtg.QPolygonF(n)
+        ptr = polygon.data()
+        ptr.setsize(n * 2 * np.dtype(np.float64).itemsize)
+        pts = np.frombuffer(ptr, dtype=np.float64).reshape(-1, 2)
+        if n < len(self.xy):
+            pts[:] = self.xy[:n]
+        else:
+            # Unroll the full ring buffer so the path runs from the oldest point to the newest
+            h = self.head
+            pts[:n - h] = self.xy[h:]
+            pts[n - h:] = self.xy[:h]
+        self.path = qtg.QPainterPath()
+        self.path.addPolygon(polygon)
+        self._dirty = False
 
     def paint(self, painter, option, widget=None):
         """Draw the tracer path and a marker at the current point.
@@ -371,15 +547,12 @@ class Tracer(qtw.QGraphicsItem):
             option (QStyleOptionGraphicsItem): Style options.
             widget (QWidget, optional): The widget being painted on.
         """
+        if self._dirty:
+            self.refresh()  # Rebuild a path that was deferred while the tracer was out of view
         if self.pen is not None:
             painter.setPen(self.pen)
-        path = qtg.QPainterPath()
-        if len(self.pts) > 0:
-            path.moveTo(self.pts[0])
-        for i in range(1, len(self.pts)):
-            path.lineTo(self.pts[i])
-        painter.drawPath(path)  # Draw the tracer path
-        pt = self.pts[len(self.pts) - 1]
+        painter.drawPath(self.path)  # Draw the tracer path
+        pt = self.lastPt()
         painter.setPen(self.penOutline)
         painter.drawEllipse(qtc.QRectF(pt.x() - 2.5, pt.y() - 2.5, 5, 5))  # Draw the current point marker
 
@@ -555,7 +728,7 @@ class LinearSpring(qtw.QGraphicsItem):
                 painter.drawText(qtc.QPointF((self.coilsWidth / 2.0) + 10, 0), self.label)
             self.transformation.reset()
         except Exception as e:
-            logging.error(f"Error in LinearSpring.paint: {str(e)}")
+            logging.error("Error in LinearSpring.paint: %s", e)
 
 class DashPot(qtw.QGraphicsItem):
     """A dashpot (damper) connecting two points in the four-bar linkage.
@@ -713,7 +886,7 @@ class DashPot(qtw.QGraphicsItem):
             painter.drawText(qtc.QPointF(-fm.width(text) / 2.0, fm.height() / 1.5), text)  # Draw force label
             self.transformation.reset()
         except Exception as e:
-            logging.error(f"Error in DashPot.paint: {str(e)}")
+            logging.error("Error in DashPot.paint: %s", e)
 
 class FourBarLinkage_Model:
     """Model for the four-bar linkage, managing its components and state.
@@ -731,6 +904,12 @@ class FourBarLinkage_Model:
         Tracer1 (Tracer): Tracer for the Input link end.
         Tracer2 (Tracer): Tracer for the midpoint of the Coupler.
         Tracer3 (Tracer): Tracer for a point on the Coupler.
+        angles (numpy.ndarray): Angles of the Ground, Input, Coupler and Output links in radians.
+        lengths (numpy.ndarray): Lengths of the Ground, Input, Coupler and Output links.
+        joints (numpy.ndarray): Positions of the Input pivot, Input end, Output end and Output pivot, shape (4, 2).
+        tracer_xy (numpy.ndarray): Ring buffers of traced points for Tracer0 to Tracer3, shape (4, capacity, 2).
+        tracer_head (numpy.ndarray): Next write slot of each tracer ring buffer.
+        tracer_count (numpy.ndarray): Number of points stored in each tracer ring buffer.
         controller (FourBarLinkage_Controller): Reference to the controller.
     """
 
@@ -748,8 +927,34 @@ class FourBarLinkage_Model:
         self.Tracer1 = Tracer()
         self.Tracer2 = Tracer()
         self.Tracer3 = Tracer()
+        self.angles = np.zeros(4, dtype=np.float32)
+        self.lengths = np.zeros(4, dtype=np.float32)
+        self.joints = np.zeros((4, 2), dtype=np.float32)
+        self.tracer_xy = np.empty((4, 1000, 2), dtype=np.float32)
+        self.tracer_head = np.zeros(4, dtype=np.int32)
+        self.tracer_count = np.zeros(4, dtype=np.int32)
+        self.bindState()
         self.controller = None
 
+    def bindState(self):
+        """Point the links and tracers at the shared model arrays and record the joint positions."""
+        for i, link in enumerate((self.GroundLink, self.InputLink, self.DragLink, self.OutputLink)):
+            link.bindState(self.angles, self.lengths, i)
+        for i, tracer in enumerate(self.tracers()):
+            tracer.bindBuffer(self.tracer_xy, self.tracer_head, self.tracer_count, i)
+        self.joints[0] = (self.InputLink.stPt.x(), self.InputLink.stPt.y())
+        self.joints[1] = (self.InputLink.enPt.x(), self.InputLink.enPt.y())
+        self.joints[2] = (self.OutputLink.enPt.x(), self.OutputLink.enPt.y())
+        self.joints[3] = (self.OutputLink.stPt.x(), self.OutputLink.stPt.y())
+
+    def tracers(self):
+        """Return the tracers in buffer order.
+
+        Returns:
+            tuple: (Tracer0, Tracer1, Tracer2, Tracer3).
+        """
+        return self.Tracer0, self.Tracer1, self.Tracer2, self.Tracer3
+
     def setInputLength(self, L=10):
         """Set the length of the Input link and update dependent components.
 
@@ -764,7 +969,7 @@ class FourBarLinkage_Model:
             self.DragLink.stPt.setX(self.InputLink.enPt.x())
             self.DragLink.stPt.setY(self.InputLink.enPt.y())
         except Exception as e:
-            logging.error(f"Error in setInputLength: {str(e)}")
+            logging.error("Error in setInputLength: %s", e)
 
     def setOutputLength(self, L=10):
         """Set the length of the Output link and update dependent components.
@@ -780,19 +985,18 @@ class FourBarLinkage_Model:
             self.DragLink.enPt.setX(self.OutputLink.enPt.x())
             self.DragLink.enPt.setY(self.OutputLink.enPt.y())
         except Exception as e:
-            logging.error(f"Error in setOutputLength: {str(e)}")
+            logging.error("Error in setOutputLength: %s", e)
 
     def moveLinkage(self, pt=qtc.QPointF(0, 0)):
         """Update the positions of the linkage components based on a new point.
 
-        Uses a numerical solver to ensure kinematic consistency.
+        Solves the loop-closure equation in closed form, keeping the assembly branch closest to the previous
+        Output link angle.
 
         Args:
             pt (QPointF): New position for the Input link's end point.
         """
         try:
-            l1 = self.InputLink.length
-            l3 = self.OutputLink.length
             x = pt.x()
             y = pt.y()
             # Calculate the Input link angle based on the new position
@@ -801,71 +1005,105 @@ class FourBarLinkage_Model:
             else:
                 self.angle1 = math.atan(-(y - self.InputLink.stPt.y()) / (x - self.InputLink.stPt.x()))
                 self.angle1 += math.pi if x < self.InputLink.stPt.x() else 0
-            # Calculate the initial guess for the Output link angle
-            if (self.OutputLink.enPt.x() == self.OutputLink.stPt.x()):
-                self.angle2 = math.pi / 2 if self.OutputLink.enPt.y() < self.OutputLink.stPt.y() else math.pi * 3.0 / 2.0
-            else:
-                self.angle2 = math.atan(-(self.OutputLink.enPt.y() - self.DragLink.stPt.y()) / (
-                        self.OutputLink.enPt.x() - self.OutputLink.stPt.x()))
-                self.angle2 += math.pi if self.OutputLink.enPt.x() < self.OutputLink.stPt.x() else 0
-            self.InputLink.enPt.setX(self.InputLink.stPt.x() + math.cos(self.angle1) * l1)
-            self.InputLink.enPt.setY(self.InputLink.stPt.y() - math.sin(self.angle1) * l1)
-            x1 = self.InputLink.enPt.x()
-            y1 = self.InputLink.enPt.y()
-            self.lTest = self.DragLink.length
-
-            def fn1(angle2):
-                """Helper function for the numerical solver to find the Output link angle.
-
-                Args:
-                    angle2 (float): Angle of the Output link in radians.
-
-                Returns:
-                    float: Difference between desired and actual Coupler length.
-                """
-                x2 = self.OutputLink.stPt.x() + l3 * math.cos(angle2)
-                y2 = self.OutputLink.stPt.y() - l3 * math.sin(angle2)
-                self.lTest = math.sqrt(math.pow(x2 - x1, 2) + math.pow(y2 - y1, 2))
-                return self.DragLink.length - self.lTest
-
-            result = optimize.fsolve(fn1, [self.angle2])  # Solve for the Output link angle
-            if abs(self.lTest - self.DragLink.length) > 0.001:
-                # If the solver fails, revert to previous angles
-                self.angle2 = getattr(self, 'prevBeta', self.angle2)
-                self.angle1 = getattr(self, 'prevAlpha', self.angle1)
-                self.InputLink.enPt.setX(self.InputLink.stPt.x() + math.cos(self.angle1) * l1)
-                self.InputLink.enPt.setY(self.InputLink.stPt.y() - math.sin(self.angle1) * l1)
+            beta, valid = self.solveOutputAngle(self.angle1, getattr(self, 'prevBeta', self.OutputLink.angle))
+            if not valid:
+                # If the linkage cannot be assembled, revert to previous angles
+                self.angle2 = getattr(self, 'prevBeta', self.OutputLink.angle)
+                self.angle1 = getattr(self, 'prevAlpha', self.InputLink.angle)
             else:
-                self.angle2 = result[0]
-                self.prevAlpha = self.angle1
-                self.prevBeta = self.angle2
-
-            # Update the Output link position
-            self.OutputLink.enPt.setX(self.OutputLink.stPt.x() + l3 * math.cos(self.angle2))
-            self.OutputLink.enPt.setY(self.OutputLink.stPt.y() - l3 * math.sin(self.angle2))
-            pt1 = dc(self.InputLink.enPt)
-            pt0 = dc(self.OutputLink.enPt)
-            ptMid = (pt0 + pt1) / 2
-            # Update tracer points
-            self.Tracer1.pts.append(pt1)
-            self.Tracer0.pts.append(pt0)
-            self.Tracer2.pts.append(ptMid)
-            self.Tracer3.pts.append(ptMid + 0.5 * (pt0 - ptMid))
-            self.Spring.enPt = dc(self.Tracer3.lastPt())
-            self.Spring.getForce()
-            self.DashPot.enPt = dc(self.Tracer3.lastPt())
-            if self.controller:
-                self.DashPot.force = self.controller.dashpot_force
-            # Limit tracer points to prevent memory issues
-            if len(self.Tracer1.pts) >= 1000:
-                self.Tracer0.pts = self.Tracer0.pts[1:]
-                self.Tracer1.pts = self.Tracer1.pts[1:]
-                self.Tracer2.pts = self.Tracer2.pts[1:]
-                self.Tracer3.pts = self.Tracer3.pts[1:]
-            self.DragLink.stPt = self.InputLink.enPt
-            self.DragLink.enPt = self.OutputLink.enPt
+                self.angle2 = float(beta)
+            self.setPose(self.angle1, self.angle2)
         except Exception as e:
-            logging.error(f"Error in moveLinkage: {str(e)}")
+            logging.error("Error in moveLinkage: %s", e)
+
+    def setPose(self, alpha, beta):
+        """Place the Input and Output links at the given angles and update the dependent components.
+
+        The pose becomes the reference moveLinkage uses to pick the assembly branch and to fall back to when
+        the linkage cannot close, so it has to be one that can be assembled.
+
+        Args:
+            alpha (float): Input link angle in radians.
+            beta (float): Output link angle in radians.
+        """
+        self.prevAlpha = alpha
+        self.prevBeta = beta
+        self.angles[1] = alpha % (2 * math.pi)
+        self.angles[3] = beta % (2 * math.pi)
+        pose_from_angles(self.angles, self.lengths, self.joints)
+        j = self.joints
+        self.InputLink.enPt.setX(float(j[1, 0]))
+        self.InputLink.enPt.setY(float(j[1, 1]))
+        self.OutputLink.enPt.setX(float(j[2, 0]))
+        self.OutputLink.enPt.setY(float(j[2, 1]))
+        pt1 = qtc.QPointF(self.InputLink.enPt)
+        pt0 = qtc.QPointF(self.OutputLink.enPt)
+        ptMid = (pt0 + pt1) / 2
+        # Update tracer points, the tracers drop their oldest point once full
+        self.Tracer1.addPoint(pt1)
+        self.Tracer0.addPoint(pt0)
+        self.Tracer2.addPoint(ptMid)
+        self.Tracer3.addPoint(ptMid + 0.5 * (pt0 - ptMid))
+        # lastPt() already returns a fresh QPointF, so no copy is needed
+        self.Spring.enPt = self.Tracer3.lastPt()
+        self.Spring.getForce()
+        self.DashPot.enPt = self.Tracer3.lastPt()
+        if self.controller:
+            self.DashPot.force = self.controller.dashpot_force
+        self.DragLink.stPt = self.InputLink.enPt
+        self.DragLink.enPt = self.OutputLink.enPt
+
+    def solveOutputAngle(self, alpha, beta0):
+        """Solve the loop-closure equation for the Output link angle in closed form.
+
+        Works on a scalar or an array of Input link angles. Of the two assembly branches, the one closest
+        to beta0 at the first angle is used for every angle.
+
+        Args:
+            alpha (float or numpy.ndarray): Input link angle(s) in radians.
+            beta0 (float): Reference Output link angle in radians used to pick the branch.
+
+        Returns:
+            tuple: (beta, valid) arrays, where valid is False where the linkage cannot be assembled.
+        """
+        alpha = np.asarray(alpha, dtype=np.float64)
+        l1, l2, l3 = (float(L) for L in self.lengths[1:])
+        (ax, ay), (dx, dy) = self.joints[0].astype(np.float64), self.joints[3].astype(np.float64)
+        # Vector from the Input link end to the Output pivot, with y pointing up
+        px = dx - (ax + l1 * np.cos(alpha))
+        py = ay - l1 * np.sin(alpha) - dy
+        R = np.hypot(px, py)
+        # |P + l3*(cos(beta), sin(beta))| = l2  ->  R*cos(beta - phi) = (l2^2 - l3^2 - R^2) / (2*l3)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = (l2 * l2 - l3 * l3 - R * R) / (2 * l3 * R)
+        valid = np.abs(ratio) <= 1.0
+        phi = np.arctan2(py, px)
+        delta = np.arccos(np.clip(ratio, -1.0, 1.0))
+        phi0, delta0 = phi.flat[0], delta.flat[0]
+        dUp = abs((phi0 + delta0 - beta0 + math.pi) % (2 * math.pi) - math.pi)
+        dDown = abs((phi0 - delta0 - beta0 + math.pi) % (2 * math.pi) - math.pi)
+        sign = 1.0 if dUp <= dDown else -1.0
+        beta = (phi + sign * delta) % (2 * math.pi)
+        return beta, valid
+
+    def dashPotLengths(self, alpha, beta):
+        """Compute the DashPot length for arrays of Input and Output link angles.
+
+        Args:
+            alpha (numpy.ndarray): Input link angles in radians.
+            beta (numpy.ndarray): Output link angles in radians.
+
+        Returns:
+            numpy.ndarray: Distance from the DashPot start to the Coupler tracer point for each pose.
+        """
+        bx = self.InputLink.stPt.x() + self.InputLink.length * np.cos(alpha)
+        by = self.InputLink.stPt.y() - self.InputLink.length * np.sin(alpha)
+        cx = self.OutputLink.stPt.x() + self.OutputLink.length * np.cos(beta)
+        cy = self.OutputLink.stPt.y() - self.OutputLink.length * np.sin(beta)
+        # Tracer3 sits three quarters of the way along the Coupler
+        tx = 0.25 * bx + 0.75 * cx
+        ty = 0.25 * by + 0.75 * cy
+        return np.hypot(tx - self.DashPot.stPt.x(), ty - self.DashPot.stPt.y())
 #endregion
 
 #region view
@@ -903,7 +1141,9 @@ class FourBarLinkage_View:
         self.scene.setSceneRect(-200, -200, 400, 400)  # Set the scene size
         self.gv_Main.setScene(self.scene)
         self.setupPensAndBrushes()
+        # Many small items move on every drag step, so repaint the whole viewport instead of tracking dirty regions
         self.gv_Main.setViewportUpdateMode(qtw.QGraphicsView.FullViewportUpdate)
+        self.gv_Main.setOptimizationFlag(qtw.QGraphicsView.DontAdjustForAntialiasing, True)
 
     def setupPensAndBrushes(self):
         """Initialize pens and brushes for drawing the linkage components."""
@@ -961,24 +1201,28 @@ class FourBarLinkage_View:
             FBL_M.InputLink.name = "Input"
             FBL_M.DragLink.name = "Coupler"
             FBL_M.OutputLink.name = "Output"
+            # The frame and pivots never move, so let Qt reuse their rendered pixmaps between frames, as drawAGrid
+            # already does for the grid
+            for item in (FBL_M.Pivot0, FBL_M.Pivot1, FBL_M.GroundLink):
+                item.setCacheMode(qtw.QGraphicsItem.DeviceCoordinateCache)
             # Initialize tracers
             FBL_M.Tracer0 = Tracer(x=100, y=-150, pen=self.penTracer)
             self.scene.addItem(FBL_M.Tracer0)
             FBL_M.Tracer1 = Tracer(x=-100, y=-60, pen=self.penTracer)
             self.scene.addItem(FBL_M.Tracer1)
             FBL_M.Tracer2 = Tracer(0, 0, pen=self.penTracer)
-            FBL_M.Tracer2.pts[0] = (FBL_M.Tracer0.pts[0] + FBL_M.Tracer1.pts[0]) / 2
+            FBL_M.Tracer2.reset((FBL_M.Tracer0.firstPt() + FBL_M.Tracer1.firstPt()) / 2)
             self.scene.addItem(FBL_M.Tracer2)
             FBL_M.Tracer3 = Tracer(0, 0, pen=self.penTracer)
-            FBL_M.Tracer3.pts[0] = (FBL_M.Tracer0.pts[0] + FBL_M.Tracer2.pts[0]) / 2
+            FBL_M.Tracer3.reset((FBL_M.Tracer0.firstPt() + FBL_M.Tracer2.firstPt()) / 2)
             self.scene.addItem(FBL_M.Tracer3)
             # Add spring and dashpot
-            FBL_M.Spring = LinearSpring(FBL_M.Pivot1.pt, FBL_M.Tracer3.pts[0], 20, 50)
+            FBL_M.Spring = LinearSpring(FBL_M.Pivot1.pt, FBL_M.Tracer3.firstPt(), 20, 50)
             self.scene.addItem(FBL_M.Spring)
             FBL_M.DashPot = DashPot(FBL_M.Pivot1.pt, FBL_M.Tracer3.lastPt(), 10, 80)
             self.scene.addItem(FBL_M.DashPot)
         except Exception as e:
-            logging.error(f"Error in BuildScene: {str(e)}")
+            logging.error("Error in BuildScene: %s", e)
 
     def drawAGrid(self, DeltaX=10, DeltaY=10, Height=200, Width=200, CenterX=0, CenterY=0, Pen=None, Brush=None, SubGrid=None):
         """Draw a grid in the background of the scene.
@@ -1003,19 +1247,23 @@ class FourBarLinkage_View:
         Dx = DeltaX
         Dy = DeltaY
         pen = qtg.QPen() if Pen is None else Pen
+        # The grid is static, so every grid item is drawn from a device-coordinate pixmap cache
         if Brush is not None:
             rect = self.drawARectangle(left, top, width, height)
             rect.setBrush(Brush)
             rect.setPen(pen)
+            rect.setCacheMode(qtw.QGraphicsItem.DeviceCoordinateCache)
         x = left
         while x <= right:
             lVert = self.drawALine(x, top, x, bottom)
             lVert.setPen(pen)  # Draw vertical grid lines
+            lVert.setCacheMode(qtw.QGraphicsItem.DeviceCoordinateCache)
             x += Dx
         y = top
         while y <= bottom:
             lHor = self.drawALine(left, y, right, y)
             lHor.setPen(pen)  # Draw horizontal grid lines
+            lHor.setCacheMode(qtw.QGraphicsItem.DeviceCoordinateCache)
             y += Dy
 
     def drawARectangle(self, leftX, topY, widthX, heightY, pen=None, brush=None):
@@ -1216,10 +1464,21 @@ class FourBarLinkage_Controller:
         nud_spring (QDoubleSpinBox): Widget for the spring constant.
         is_simulation_running (bool): Whether the simulation is currently running.
         timer (QTimer): Timer for updating the simulation.
-        t (numpy.ndarray): Time array for the simulation.
-        prev_time (float): Previous time step for velocity calculation.
-        prev_position (float): Previous position for velocity calculation.
-        prev_length (float): Previous dashpot length for velocity calculation.
+        dt (float): Integration time step in seconds.
+        n_steps (int): Number of integration steps per simulation run.
+        equilibrium_angle (float): Input link angle at which the spring is relaxed, in radians.
+        traj_alpha (numpy.ndarray): Precomputed Input link angles for the simulation run.
+        traj_beta (numpy.ndarray): Precomputed Output link angles for the simulation run.
+        traj_force (numpy.ndarray): Precomputed dashpot forces for the simulation run.
+        traj_i (int): Index of the next trajectory sample to display.
+        elapsed (QElapsedTimer): Wall-clock timer the playback position is derived from.
+        elapsed_offset (float): Playback time in seconds accumulated before the last pause.
+        unit_response (numpy.ndarray): Displacement response to a unit initial displacement for response_key.
+        response_key (tuple): (I, k, c) that unit_response was integrated for.
+        executor (ThreadPoolExecutor): Worker pool for parameter sweeps, created on first use.
+        sweep_candidates (numpy.ndarray): Damping coefficients tried by the damping sweep.
+        sweep_max_overshoot (float): Overshoot limit the damping sweep is looking for.
+        sweep_futures (list): Pending overshoot results of the damping sweep, one per candidate.
         dashpot_force (float): Current force exerted by the dashpot.
     """
 
@@ -1255,10 +1514,21 @@ class FourBarLinkage_Controller:
         self.is_simulation_running = False
         self.timer = qtc.QTimer()
         self.timer.timeout.connect(self.update_simulation)
-        self.t = np.linspace(0, 10, 1000)  # Time array for simulation
-        self.prev_time = 0
-        self.prev_position = 0
-        self.prev_length = 0
+        self.dt = 0.01
+        self.n_steps = 1000
+        self.equilibrium_angle = math.pi / 2
+        self.traj_alpha = np.empty(0, dtype=np.float32)
+        self.traj_beta = np.empty(0, dtype=np.float32)
+        self.traj_force = np.empty(0, dtype=np.float32)
+        self.traj_i = 0
+        self.elapsed = qtc.QElapsedTimer()
+        self.elapsed_offset = 0.0
+        self.unit_response = None
+        self.response_key = None
+        self.executor = None
+        self.sweep_candidates = None
+        self.sweep_max_overshoot = 0.05
+        self.sweep_futures = []
         self.dashpot_force = 0
         self.FBL_M.controller = self
 
@@ -1269,6 +1539,7 @@ class FourBarLinkage_Controller:
     def buildScene(self):
         """Build the initial four-bar linkage scene."""
         self.FBL_V.BuildScene(self.FBL_M)
+        self.FBL_M.bindState()
 
     def setInputLinkLength(self):
         """Update the Input link length based on the UI input."""
@@ -1283,7 +1554,7 @@ class FourBarLinkage_Controller:
             )
             self.moveLinkage(pt)
         except Exception as e:
-            logging.error(f"Error in setInputLinkLength: {str(e)}")
+            logging.error("Error in setInputLinkLength: %s", e)
 
     def setOutputLinkLength(self):
         """Update the Output link length based on the UI input."""
@@ -1298,7 +1569,7 @@ class FourBarLinkage_Controller:
             )
             self.moveLinkage(pt)
         except Exception as e:
-            logging.error(f"Error in setOutputLinkLength: {str(e)}")
+            logging.error("Error in setOutputLinkLength: %s", e)
 
     def setAngleLimits(self, min_angle, max_angle):
         """Set the minimum and maximum angle limits for the Input link.
@@ -1321,7 +1592,7 @@ class FourBarLinkage_Controller:
             )
             self.moveLinkage(pt)
         except Exception as e:
-            logging.error(f"Error in setAngleLimits: {str(e)}")
+            logging.error("Error in setAngleLimits: %s", e)
 
     def setDampingCoefficient(self, c):
         """Set the damping coefficient for the dashpot.
@@ -1332,7 +1603,7 @@ class FourBarLinkage_Controller:
         try:
             self.FBL_M.DashPot.setc(c)
         except Exception as e:
-            logging.error(f"Error in setDampingCoefficient: {str(e)}")
+            logging.error("Error in setDampingCoefficient: %s", e)
 
     def setMass(self, m):
         """Set the mass of the linkage system.
@@ -1347,7 +1618,7 @@ class FourBarLinkage_Controller:
                 self.nud_mass.setValue(m)
             self.FBL_M.InputLink.mass = m
         except Exception as e:
-            logging.error(f"Error in setMass: {str(e)}")
+            logging.error("Error in setMass: %s", e)
 
     def setSpringConstant(self, k):
         """Set the spring constant for the spring.
@@ -1358,7 +1629,7 @@ class FourBarLinkage_Controller:
         try:
             self.FBL_M.Spring.setk(k)
         except Exception as e:
-            logging.error(f"Error in setSpringConstant: {str(e)}")
+            logging.error("Error in setSpringConstant: %s", e)
 
     def moveLinkage(self, pt):
         """Move the linkage to a new position and update the UI.
@@ -1368,98 +1639,172 @@ class FourBarLinkage_Controller:
         """
         try:
             self.FBL_M.moveLinkage(pt)
-            self.nud_input_angle.setValue(self.FBL_M.InputLink.AngleDeg())
-            self.lbl_output_angle.setText("{:0.2f}".format(self.FBL_M.OutputLink.AngleDeg()))
-            self.FBL_V.scene.update()  # Force scene update to redraw the linkage
+            self.updateDisplay()
         except Exception as e:
-            logging.error(f"Error in moveLinkage: {str(e)}")
+            logging.error("Error in moveLinkage: %s", e)
+
+    def updateDisplay(self):
+        """Show the current link angles in the UI and redraw the scene."""
+        self.nud_input_angle.setValue(self.FBL_M.InputLink.AngleDeg())
+        self.lbl_output_angle.setText("{:0.2f}".format(self.FBL_M.OutputLink.AngleDeg()))
+        self.refreshTracers()
+        self.FBL_V.scene.update()  # Force scene update to redraw the linkage
+
+    def refreshTracers(self):
+        """Rebuild the tracer paths that are in view, leaving the others to be rebuilt when painted."""
+        # Called once per frame rather than once per added point
+        gv = self.FBL_V.gv_Main
+        visibleRect = gv.mapToScene(gv.viewport().rect()).boundingRect()
+        for tracer in self.FBL_M.tracers():
+            tracer.refresh(visibleRect)
 
-    def state_equations(self, state, t, m, k, c):
-        """Define the state equations for the dynamic simulation.
+    def startSimulation(self, initial_angle, m, k, c):
+        """Start the dynamic simulation of the linkage.
 
         Args:
-            state (list): Current state [angle, angular velocity].
-            t (float): Current time.
+            initial_angle (float): Initial angle of the Input link in degrees.
             m (float): Mass of the system.
             k (float): Spring constant.
             c (float): Damping coefficient.
-
-        Returns:
-            list: Derivatives [angular velocity, angular acceleration].
         """
         try:
-            theta, omega = state
-            I = m * self.FBL_M.InputLink.length ** 2  # Moment of inertia
+            I = self.momentOfInertia(m)
             if I <= 0:
                 raise ValueError("Moment of inertia must be positive")
-            # Calculate forces
-            spring_force = self.FBL_M.Spring.getForce()
-            # Use the dashpot force computed from length change rate
-            dashpot_force = self.dashpot_force
+            self.is_simulation_running = True
+            initial_angle_rad = math.radians(initial_angle)
             # Equation of motion: I * alpha = -k * (theta - equilibrium) - c * omega
-            # Equilibrium is at 90 degrees (pi/2 radians)
-            equilibrium_angle = math.pi / 2
-            alpha = (-k * (theta - equilibrium_angle) - dashpot_force) / I
-            return [omega, alpha]
+            # The system is linear, so the response from rest scales with the initial displacement and only
+            # has to be integrated again when (I, k, c) change
+            key = (float(I), float(k), float(c))
+            if key != self.response_key:
+                self.unit_response = simulate(1.0, 0.0, key[0], key[1], key[2], self.dt, self.n_steps)[:, 0]
+                self.response_key = key
+            # Precompute the whole pose trajectory so the timer only has to index into it
+            alpha = self.equilibrium_angle + (initial_angle_rad - self.equilibrium_angle) * self.unit_response
+            beta, valid = self.FBL_M.solveOutputAngle(alpha, self.FBL_M.OutputLink.angle)
+            # Hold the last pose that can be assembled wherever the linkage cannot close
+            last = np.maximum.accumulate(np.where(valid, np.arange(len(valid)), -1))
+            held = last < 0
+            last[held] = 0
+            alpha = np.where(held, self.FBL_M.InputLink.angle, alpha[last])
+            beta = np.where(held, self.FBL_M.OutputLink.angle, beta[last])
+            # Dashpot force from the rate of change of its length
+            lengths = self.FBL_M.dashPotLengths(alpha, beta)
+            force = self.FBL_M.DashPot.c * np.diff(lengths, prepend=lengths[0]) / self.dt
+            self.traj_alpha = alpha.astype(np.float32)
+            self.traj_beta = beta.astype(np.float32)
+            self.traj_force = force.astype(np.float32)
+            self.traj_i = 0
+            self.elapsed_offset = 0.0
+            self.elapsed.start()
+            self.timer.start(10)  # Update every 10 ms
         except Exception as e:
-            logging.error(f"Error in state_equations: {str(e)}")
-            return [0, 0]
+            logging.error("Error in startSimulation: %s", e)
 
-    def startSimulation(self, initial_angle, m, k, c):
-        """Start the dynamic simulation of the linkage.
+    def momentOfInertia(self, m):
+        """Return the moment of inertia of a mass carried at the end of the Input link.
 
         Args:
-            initial_angle (float): Initial angle of the Input link in degrees.
             m (float): Mass of the system.
+
+        Returns:
+            float: Moment of inertia about the Input link pivot.
+        """
+        return m * self.FBL_M.InputLink.length ** 2
+
+    def overshoot(self, I, k, c, dt):
+        """Return the overshoot of the free response from a unit initial displacement.
+
+        Args:
+            I (float): Moment of inertia.
             k (float): Spring constant.
             c (float): Damping coefficient.
+            dt (float): Integration time step.
+
+        Returns:
+            float: Largest excursion past equilibrium as a fraction of the initial displacement.
+        """
+        x = simulate(1.0, 0.0, I, k, c, dt, self.n_steps)[:, 0]
+        return max(0.0, -float(x.min()))
+
+    def startDampingSweep(self, m, k, max_overshoot=0.05, n_candidates=64):
+        """Start searching for the smallest damping coefficient that keeps the overshoot within a limit.
+
+        Damping values from zero up to critical damping are simulated on a thread pool. The integration
+        kernel releases the GIL, so the runs use separate cores while the GUI keeps running; poll
+        dampingSuggestion() for the result.
+
+        Args:
+            m (float): Mass of the system.
+            k (float): Spring constant.
+            max_overshoot (float): Largest acceptable overshoot as a fraction of the initial displacement.
+            n_candidates (int): Number of damping values to try.
         """
         try:
-            self.is_simulation_running = True
-            initial_angle_rad = math.radians(initial_angle)
-            initial_state = [initial_angle_rad, 0]  # [angle, angular velocity]
-            # Solve the differential equations
-            solution = odeint(self.state_equations, initial_state, self.t, args=(m, k, c))
-            self.simulation_data = solution
-            self.current_step = 0
-            self.prev_time = 0
-            self.prev_position = initial_angle_rad
-            self.prev_length = self.FBL_M.DashPot.freeLength
-            self.timer.start(10)  # Update every 10 ms
+            self.cancelDampingSweep()
+            I = self.momentOfInertia(m)
+            if I <= 0 or k <= 0:
+                return
+            # Cover at least one undamped period so the first swing past equilibrium is captured, stretching
+            # the step for slow systems instead of integrating more steps
+            dt = max(self.dt, 2.0 * math.pi * math.sqrt(I / k) / (self.n_steps - 1))
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+            self.sweep_candidates = np.linspace(0.0, 2.0 * math.sqrt(k * I), n_candidates)
+            self.sweep_max_overshoot = max_overshoot
+            self.sweep_futures = [self.executor.submit(self.overshoot, I, k, c, dt) for c in self.sweep_candidates]
+        except Exception as e:
+            logging.error("Error in startDampingSweep: %s", e)
+
+    def dampingSuggestion(self):
+        """Return the result of the damping sweep started by startDampingSweep.
+
+        Returns:
+            tuple: (done, c) where done tells whether the sweep has finished and c is the suggested damping
+                coefficient, or None if no sweep was run or it failed.
+        """
+        try:
+            if not all(f.done() for f in self.sweep_futures):
+                return False, None
+            if not self.sweep_futures or any(f.cancelled() for f in self.sweep_futures):
+                return True, None
+            # Critical damping has no overshoot, so the last candidate always qualifies
+            for c, f in zip(self.sweep_candidates, self.sweep_futures):
+                if f.result() <= self.sweep_max_overshoot:
+                    return True, float(c)
+            return True, float(self.sweep_candidates[-1])
         except Exception as e:
-            logging.error(f"Error in startSimulation: {str(e)}")
+            logging.error("Error in dampingSuggestion: %s", e)
+            return True, None
+
+    def cancelDampingSweep(self):
+        """Drop the runs of the damping sweep that have not started yet."""
+        for f in self.sweep_futures:
+            f.cancel()
+        self.sweep_futures = []
 
     def update_simulation(self):
-        """Update the simulation state at each time step."""
+        """Show the precomputed pose matching the elapsed playback time.
+
+        The sample is picked from the wall-clock time since the run started, so late timer ticks skip
+        samples instead of slowing the animation down.
+        """
         try:
-            if self.current_step < len(self.simulation_data) and self.is_simulation_running:
-                theta = self.simulation_data[self.current_step][0]
-                current_time = self.t[self.current_step]
-                # Get previous dashpot length
-                prev_length = self.prev_length
-                # Update the linkage position
-                pt = qtc.QPointF(
-                    self.FBL_M.InputLink.stPt.x() + self.FBL_M.InputLink.length * math.cos(theta),
-                    self.FBL_M.InputLink.stPt.y() - self.FBL_M.InputLink.length * math.sin(theta)
-                )
-                self.moveLinkage(pt)
-                # Get current dashpot length
-                current_length = self.FBL_M.DashPot.getLength()
-                # Calculate velocity (rate of change of length)
-                if current_time != self.prev_time:
-                    velocity = (current_length - prev_length) / (current_time - self.prev_time)
-                else:
-                    velocity = 0
-                self.dashpot_force = self.FBL_M.DashPot.c * velocity
-                self.prev_length = current_length
-                self.prev_time = current_time
-                self.prev_position = theta
-                self.current_step += 1
+            n = len(self.traj_alpha)
+            if self.traj_i < n and self.is_simulation_running:
+                t = self.elapsed_offset + self.elapsed.nsecsElapsed() * 1e-9
+                i = min(int(t / self.dt), n - 1)
+                if i >= self.traj_i:
+                    self.dashpot_force = float(self.traj_force[i])
+                    self.FBL_M.setPose(float(self.traj_alpha[i]), float(self.traj_beta[i]))
+                    self.updateDisplay()
+                    self.traj_i = i + 1
             else:
                 self.timer.stop()
                 self.is_simulation_running = False
         except Exception as e:
-            logging.error(f"Error in update_simulation: {str(e)}")
+            logging.error("Error in update_simulation: %s", e)
 
     def pauseResumeSimulation(self):
         """Toggle between pausing and resuming the simulation."""
@@ -1467,23 +1812,23 @@ class FourBarLinkage_Controller:
             if self.is_simulation_running:
                 self.timer.stop()
                 self.is_simulation_running = False
+                self.elapsed_offset += self.elapsed.nsecsElapsed() * 1e-9
             else:
+                self.elapsed.start()
                 self.timer.start(10)
                 self.is_simulation_running = True
         except Exception as e:
-            logging.error(f"Error in pauseResumeSimulation: {str(e)}")
+            logging.error("Error in pauseResumeSimulation: %s", e)
 
     def resetTracers(self):
         """Reset the tracer paths to their initial points."""
         try:
             # Reset tracer points to their initial positions
-            self.FBL_M.Tracer0.pts = [self.FBL_M.Tracer0.pts[0]]
-            self.FBL_M.Tracer1.pts = [self.FBL_M.Tracer1.pts[0]]
-            self.FBL_M.Tracer2.pts = [self.FBL_M.Tracer2.pts[0]]
-            self.FBL_M.Tracer3.pts = [self.FBL_M.Tracer3.pts[0]]
+            for tracer in self.FBL_M.tracers():
+                tracer.reset()
             # Update the scene to reflect the reset
             self.FBL_V.scene.update()
         except Exception as e:
-            logging.error(f"Error in resetTracers: {str(e)}")
+            logging.error("Error in resetTracers: %s", e)
 #endregion
 #endregion
\ No newline at end of file
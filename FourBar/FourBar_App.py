@@ -7,20 +7,35 @@ import PyQt5.QtWidgets as qtw
 import math
 import sys
 import numpy as np
-import scipy as sp
-from scipy import optimize
-from copy import deepcopy as dc
 import logging
+from logging.handlers import RotatingFileHandler
+from dataclasses import dataclass
 #endregion
 
 # Set up logging to capture errors and debugging information
 logging.basicConfig(
-    filename='../../finalandproject/Project__2025/FourBar/fourbar_debug.log',
-    level=logging.DEBUG,
+    handlers=[RotatingFileHandler('../../finalandproject/Project__2025/FourBar/fourbar_debug.log',
+                                  maxBytes=1_000_000, backupCount=2, delay=True)],
+    level=logging.WARNING,
     format='%(asctime)s:%(levelname)s:%(message)s'
 )
 
 #region class definitions
+@dataclass
+class SimParams:
+    """Simulation parameters mirrored from the spin boxes by their valueChanged signals.
+
+    Attributes:
+        m (float): Mass of the system.
+        k (float): Spring constant.
+        c (float): Damping coefficient.
+        initial_angle (float): Initial angle of the Input link in degrees.
+    """
+    m: float = 1.0
+    k: float = 100.0
+    c: float = 50.0
+    initial_angle: float = 0.0
+
 class MainWindow(Ui_Form, qtw.QWidget):
     """
     Main window class for the Four-Bar Linkage simulation application.
@@ -55,15 +70,42 @@ class MainWindow(Ui_Form, qtw.QWidget):
         self.prevBeta = self.FBL_C.FBL_M.OutputLink.angle
 
         self.lbl_OutputAngle_Val.setText("{:0.3f}".format(self.FBL_C.FBL_M.OutputLink.AngleDeg()))
-        self.nud_Link1Length.setValue(self.FBL_C.FBL_M.InputLink.length)
-        self.nud_Link3Length.setValue(self.FBL_C.FBL_M.OutputLink.length)
-
-        # Connect GUI events to controller logic
-        self._connectSignals()
+        # The lengths already match the scene, so syncing the spin boxes must not re-solve the linkage
+        with qtc.QSignalBlocker(self.nud_Link1Length):
+            self.nud_Link1Length.setValue(self.FBL_C.FBL_M.InputLink.length)
+        with qtc.QSignalBlocker(self.nud_Link3Length):
+            self.nud_Link3Length.setValue(self.FBL_C.FBL_M.OutputLink.length)
 
         # Install event filter for mouse interactions
         self.FBL_C.FBL_V.scene.installEventFilter(self)
         self.mouseDown = False  # Mouse press state
+        self._pressScenePos = qtc.QPointF()  # Scene position of the last left-button press
+        self._simulationPending = False  # A release-triggered simulation is already queued
+
+        # Coalesce window title updates from mouse moves to at most one every 30 ms
+        self._pendingTitle = None
+        # Last widget found under the cursor and its global geometry, reused while the cursor stays inside it
+        self._lastWidgetAt = (None, qtc.QRect())
+        self._titleTimer = qtc.QTimer(self)
+        self._titleTimer.setSingleShot(True)
+        self._titleTimer.setInterval(30)
+        self._titleTimer.timeout.connect(self._flushTitle)
+        # Underdamped warning waiting for the damping suggestion computed in the background
+        self._warningBox = None
+        self._warningText = ""
+        self._hintTimer = qtc.QTimer(self)
+        self._hintTimer.setInterval(50)
+        self._hintTimer.timeout.connect(self._showDampingHint)
+
+        # Simulation parameters, kept in sync with the spin boxes so startSimulation does not have to query them
+        self.params = SimParams(m=self.nud_Mass.value(), k=self.nud_Spring.value(), c=self.nud_Damping.value(),
+                                initial_angle=self.nud_InputAngle.value())
+
+        # Last simulation parameters, so the damping check only runs when they change
+        self._last_mkc = (None, None, None)
+
+        # Connect GUI events to controller logic once every initial value is in place
+        self._connectSignals()
 
         self.show()  # Display the application window
 
@@ -107,6 +149,7 @@ class MainWindow(Ui_Form, qtw.QWidget):
         self.nud_Damping.valueChanged.connect(self.updateDamping)
         self.nud_Mass.valueChanged.connect(self.updateMass)
         self.nud_Spring.valueChanged.connect(self.updateSpring)
+        self.nud_InputAngle.valueChanged.connect(self.updateInitialAngle)
         self.btn_Simulate.clicked.connect(self.startSimulation)
         self.btn_PauseResume.clicked.connect(self.pauseResumeSimulation)
         self.btn_ResetTracers.clicked.connect(self.resetTracers)
@@ -130,41 +173,87 @@ class MainWindow(Ui_Form, qtw.QWidget):
                 self.nud_MaxAngle.setValue(max_angle)
             self.FBL_C.setAngleLimits(min_angle, max_angle)
         except Exception as e:
-            logging.error(f"Error in updateAngleLimits: {str(e)}")
+            logging.error("Error in updateAngleLimits: %s", e)
 
     def updateDamping(self):
         try:
-            self.FBL_C.setDampingCoefficient(self.nud_Damping.value())
+            self.params.c = self.nud_Damping.value()
+            self.FBL_C.setDampingCoefficient(self.params.c)
         except Exception as e:
-            logging.error(f"Error in updateDamping: {str(e)}")
+            logging.error("Error in updateDamping: %s", e)
 
     def updateMass(self):
         try:
-            self.FBL_C.setMass(self.nud_Mass.value())
+            self.params.m = self.nud_Mass.value()
+            self.FBL_C.setMass(self.params.m)
         except Exception as e:
-            logging.error(f"Error in updateMass: {str(e)}")
+            logging.error("Error in updateMass: %s", e)
 
     def updateSpring(self):
         try:
-            self.FBL_C.setSpringConstant(self.nud_Spring.value())
+            self.params.k = self.nud_Spring.value()
+            self.FBL_C.setSpringConstant(self.params.k)
         except Exception as e:
-            logging.error(f"Error in updateSpring: {str(e)}")
+            logging.error("Error in updateSpring: %s", e)
+
+    def updateInitialAngle(self, value):
+        """Keep the simulation's initial angle in step with the Input angle spin box."""
+        self.params.initial_angle = value
 
     def startSimulation(self):
         """Initialize simulation with user-defined parameters, warn if underdamped."""
         try:
-            initial_angle = self.nud_InputAngle.value()
-            m, k, c = self.nud_Mass.value(), self.nud_Spring.value(), self.nud_Damping.value()
-            zeta = c / (2 * math.sqrt(k * m))  # Damping ratio
-            if zeta < 0.5:
-                qtw.QMessageBox.warning(
-                    self, "Simulation Warning",
-                    f"The system may oscillate excessively (damping ratio = {zeta:.2f}). "
-                    "Try increasing damping or decreasing spring constant."
-                )
+            p = self.params
+            initial_angle, m, k, c = p.initial_angle, p.m, p.k, p.c
+            # The mass swings on the Input link, so the damping ratio uses its moment of inertia
+            kI = k * self.FBL_C.momentOfInertia(m)
+            if kI <= 0.0:
+                # The damping ratio is undefined without inertia or stiffness, so there is nothing to warn about
+                self.FBL_C.startSimulation(initial_angle, m, k, c)
+                return
+            if (m, k, c) != self._last_mkc:
+                self._last_mkc = (m, k, c)
+                # Only warn the first time a given underdamped (m, k, c) is simulated; c*c < k*I is the
+                # damping ratio c / (2*sqrt(k*I)) < 0.5 without the square root
+                if c * c < kI:
+                    zeta = c / (2 * math.sqrt(kI))  # Damping ratio
+                    self._warningText = (f"The system may oscillate excessively (damping ratio = {zeta:.2g}). "
+                                         "Try increasing damping or decreasing spring constant.")
+                    # The suggestion is filled in by _showDampingHint once the sweep finishes
+                    self.FBL_C.startDampingSweep(m, k)
+                    self._warningBox = qtw.QMessageBox(qtw.QMessageBox.Warning, "Simulation Warning",
+                                                       self._warningText + " Looking for a better damping "
+                                                       "coefficient...", parent=self)
+                    self._hintTimer.start()
+                    self._warningBox.exec_()
+                    self._hintTimer.stop()
+                    self._warningBox = None
+                    self.FBL_C.cancelDampingSweep()
             self.FBL_C.startSimulation(initial_angle, m, k, c)
         except Exception as e:
-            logging.error(f"Error in startSimulation: {str(e)}")
+            logging.error("Error in startSimulation: %s", e)
+
+    def _showDampingHint(self):
+        """Add the suggested damping coefficient to the open warning once the sweep has finished."""
+        try:
+            done, c_suggested = self.FBL_C.dampingSuggestion()
+            if not done or self._warningBox is None:
+                return
+            self._hintTimer.stop()
+            hint = ""
+            if c_suggested is not None:
+                hint = f" A damping coefficient of about {c_suggested:.2f} keeps the overshoot under 5%"
+                if c_suggested > self.nud_Damping.maximum():
+                    hint += ", which is beyond the range of the damping control"
+                hint += "."
+            self._warningBox.setText(self._warningText + hint)
+        except Exception as e:
+            logging.error("Error in _showDampingHint: %s", e)
+
+    def _runPendingSimulation(self):
+        """Run the simulation queued by a mouse release."""
+        self._simulationPending = False
+        self.startSimulation()
 
     def pauseResumeSimulation(self):
         """Toggle simulation between paused and running states."""
@@ -172,14 +261,14 @@ class MainWindow(Ui_Form, qtw.QWidget):
             self.FBL_C.pauseResumeSimulation()
             self.btn_PauseResume.setText("Pause" if self.FBL_C.is_simulation_running else "Resume")
         except Exception as e:
-            logging.error(f"Error in pauseResumeSimulation: {str(e)}")
+            logging.error("Error in pauseResumeSimulation: %s", e)
 
     def resetTracers(self):
         """Reset all visual tracer paths in the simulation."""
         try:
             self.FBL_C.resetTracers()
         except Exception as e:
-            logging.error(f"Error in resetTracers: {str(e)}")
+            logging.error("Error in resetTracers: %s", e)
 
     def setZoom(self):
         """Scale the graphics view for zoom effect."""
@@ -187,16 +276,37 @@ class MainWindow(Ui_Form, qtw.QWidget):
             self.gv_Main.resetTransform()
             self.gv_Main.scale(self.spnd_Zoom.value(), self.spnd_Zoom.value())
         except Exception as e:
-            logging.error(f"Error in setZoom: {str(e)}")
+            logging.error("Error in setZoom: %s", e)
 
     def mouseMoveEvent(self, a0: qtg.QMouseEvent):
         """Display cursor coordinates in the window title."""
         try:
-            w = app.widgetAt(a0.globalPos())
+            w, rect = self._lastWidgetAt
+            # Skip the widget hit-test while the linkage is being dragged or the cursor is still on the same widget
+            if not self.mouseDown and not rect.contains(a0.globalPos()):
+                w = app.widgetAt(a0.globalPos())
+                rect = qtc.QRect()
+                # Containers are re-tested on every move since the cursor may enter one of their children
+                if w is not None and not any(isinstance(child, qtw.QWidget) and child.isVisible()
+                                             for child in w.children()):
+                    rect = qtc.QRect(w.mapToGlobal(qtc.QPoint(0, 0)), w.size())
+                self._lastWidgetAt = (w, rect)
             name = 'none' if w is None else w.objectName()
-            self.setWindowTitle(f"{a0.x()},{a0.y()} {name}")
+            self._setPendingTitle(f"{a0.x()},{a0.y()} {name}")
         except Exception as e:
-            logging.error(f"Error in mouseMoveEvent: {str(e)}")
+            logging.error("Error in mouseMoveEvent: %s", e)
+
+    def _setPendingTitle(self, title):
+        """Store the latest window title and schedule it to be shown."""
+        self._pendingTitle = title
+        if not self._titleTimer.isActive():
+            self._titleTimer.start()
+
+    def _flushTitle(self):
+        """Apply the most recent pending window title."""
+        if self._pendingTitle is not None:
+            self.setWindowTitle(self._pendingTitle)
+            self._pendingTitle = None
 
     def eventFilter(self, obj, event):
         """Custom event handler for scene interactions like drag, zoom, and click."""
@@ -204,8 +314,8 @@ class MainWindow(Ui_Form, qtw.QWidget):
             if obj == self.FBL_C.FBL_V.scene:
                 if event.type() == qtc.QEvent.GraphicsSceneMouseMove:
                     scenePos = event.scenePos()
-                    self.setWindowTitle(f"screen x = {event.screenPos().x()}, screen y = {event.screenPos().y()}: "
-                                        f"scene x = {scenePos.x():.2f}, scene y = {scenePos.y():.2f}")
+                    self._setPendingTitle(f"screen x = {event.screenPos().x()}, screen y = {event.screenPos().y()}: "
+                                          f"scene x = {scenePos.x():.2f}, scene y = {scenePos.y():.2f}")
                     if self.mouseDown:
                         self.FBL_C.moveLinkage(scenePos)
                 elif event.type() == qtc.QEvent.GraphicsSceneWheel:
@@ -215,12 +325,22 @@ class MainWindow(Ui_Form, qtw.QWidget):
                         self.spnd_Zoom.stepDown()
                 elif event.type() == qtc.QEvent.GraphicsSceneMousePress and event.button() == qtc.Qt.LeftButton:
                     self.mouseDown = True
+                    self._pressScenePos = event.scenePos()
                 elif event.type() == qtc.QEvent.GraphicsSceneMouseRelease:
+                    dragged = self.mouseDown and (event.scenePos() - self._pressScenePos).manhattanLength() > 2
                     self.mouseDown = False
-                    self.startSimulation()
+                    alpha = self.FBL_C.FBL_M.InputLink.angle
+                    # Only re-run the simulation when the linkage was actually dragged to a new angle
+                    if dragged and alpha != self.prevAlpha:
+                        self.prevAlpha = alpha
+                        self.prevBeta = self.FBL_C.FBL_M.OutputLink.angle
+                        if not self._simulationPending:
+                            # Coalesce releases queued in the same event loop pass into one run
+                            self._simulationPending = True
+                            qtc.QTimer.singleShot(0, self._runPendingSimulation)
             return super(MainWindow, self).eventFilter(obj, event)
         except Exception as e:
-            logging.error(f"Error in eventFilter: {str(e)}")
+            logging.error("Error in eventFilter: %s", e)
             return False
 #endregion
 
@@ -0,0 +1,80 @@
+#region imports
+import math
+import numpy as np
+from numba import njit
+#endregion
+
+#region numerical kernels
+@njit(nogil=True, cache=True, fastmath=True)
+def simulate(x0, v0, m, k, c, dt, n, F=0.0):
+    """Integrate the damped oscillator m*x'' + c*x' + k*x = F with a fixed-step RK4 scheme.
+
+    The kernel releases the GIL, so several parameter sets can be integrated in parallel threads.
+
+    Args:
+        x0 (float): Initial displacement.
+        v0 (float): Initial velocity.
+        m (float): Mass (or moment of inertia for a rotational system).
+        k (float): Spring constant.
+        c (float): Damping coefficient.
+        dt (float): Time step.
+        n (int): Number of samples to return.
+        F (float): Constant external force.
+
+    Returns:
+        numpy.ndarray: Array of shape (n, 2) holding [x, v] at each step, starting with [x0, v0].
+    """
+    out = np.empty((n, 2))
+    x = x0
+    v = v0
+    h = 0.5 * dt
+    for i in range(n):
+        out[i, 0] = x
+        out[i, 1] = v
+        # Four RHS evaluations with scalar temporaries, a = (F - c*v - k*x)/m
+        k1x = v
+        k1v = (F - c * v - k * x) / m
+        k2x = v + h * k1v
+        k2v = (F - c * k2x - k * (x + h * k1x)) / m
+        k3x = v + h * k2v
+        k3v = (F - c * k3x - k * (x + h * k2x)) / m
+        k4x = v + dt * k3v
+        k4v = (F - c * k4x - k * (x + dt * k3x)) / m
+        x += dt / 6.0 * (k1x + 2.0 * k2x + 2.0 * k3x + k4x)
+        v += dt / 6.0 * (k1v + 2.0 * k2v + 2.0 * k3v + k4v)
+    return out
+
+@njit(cache=True, fastmath=True)
+def pose_from_angles(angles, lengths, out_joints):
+    """Compute the joint positions of the four-bar linkage from its link angles.
+
+    Links and joints use the model's ordering: links are Ground, Input, Coupler and Output, joints are the
+    Input pivot, Input end, Output end and Output pivot. Angles are measured counter-clockwise with scene y
+    pointing down. The Input pivot in out_joints[0] is kept fixed, and the Coupler angle is written back
+    into angles[2].
+
+    Args:
+        angles (numpy.ndarray): Link angles in radians, shape (4,).
+        lengths (numpy.ndarray): Link lengths, shape (4,).
+        out_joints (numpy.ndarray): Joint positions, shape (4, 2), updated in place.
+    """
+    x0 = out_joints[0, 0]
+    y0 = out_joints[0, 1]
+    x3 = x0 + lengths[0] * math.cos(angles[0])
+    y3 = y0 - lengths[0] * math.sin(angles[0])
+    x1 = x0 + lengths[1] * math.cos(angles[1])
+    y1 = y0 - lengths[1] * math.sin(angles[1])
+    x2 = x3 + lengths[3] * math.cos(angles[3])
+    y2 = y3 - lengths[3] * math.sin(angles[3])
+    out_joints[1, 0] = x1
+    out_joints[1, 1] = y1
+    out_joints[2, 0] = x2
+    out_joints[2, 1] = y2
+    out_joints[3, 0] = x3
+    out_joints[3, 1] = y3
+    angles[2] = math.atan2(y1 - y2, x2 - x1) % (2.0 * math.pi)
+
+# Compile the kernels at import so the first simulation run is not delayed by the JIT
+simulate(0.0, 0.0, 1.0, 1.0, 1.0, 0.01, 2)
+pose_from_angles(np.zeros(4, dtype=np.float32), np.ones(4, dtype=np.float32), np.zeros((4, 2), dtype=np.float32))
+#endregion